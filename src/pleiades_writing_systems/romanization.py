@@ -8,20 +8,240 @@
 """
 romanization: create romanized (Latin script) versions of strings in other scripts
 """
-from arabic2latin import arabic_to_latin
-from functools import lru_cache
-import iuliia
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial, wraps
 import langcodes
 import logging
-from pprint import pformat
-from romanize import romanize as romanize_schizas
-import romanize3 as romanize_manninen
-import slugify as python_slugify
+from pathlib import Path
+import pickle
+import re
+import sys
+import time
+from typing import Iterable, NamedTuple
 from datetime import timedelta
 import unicodedata
-from webiquette.webi import Webi
-from yuconv import YuConverter
-from yuconv import TransliterationMode as YuConvTransliterationMode
+import warnings
+from pleiades_writing_systems.scripts_data import _STARTS, _SCRIPTS
+
+_logger = logging.getLogger(__name__)
+
+# maximum entries in the per-instance caches of romanize and detect_scripts results
+_ROMANIZE_CACHE_SIZE = 50000
+_SCRIPTS_CACHE_SIZE = 5000
+_LATN = ("Latn",)
+# ISO 15924 codes for the Common, Inherited, and Unknown values of the Unicode Script property
+_NON_SPECIFIC_SCRIPTS = frozenset({"Zyyy", "Zinh", "Zzzz"})
+# letters whose Unicode Script property is Latin
+_LATIN_LETTERS = frozenset(
+    c
+    for start, stop, script in zip(_STARTS, _STARTS[1:], _SCRIPTS)
+    if script == "Latn"
+    for c in map(chr, range(start, stop))
+    if c.isalpha()
+)
+# any "h" but a leading one, rewritten as "th" in romanize3 output
+_H_AFTER_FIRST_RE = re.compile(r"(?!^)h")
+# how long to rely on a fetched (or parsed) copy of the IANA language subtag registry
+_REGISTRY_MAX_AGE = timedelta(days=30)
+# script of Ancient Greek (grc); not included in langcodes default scripts
+_GRC_SCRIPT = "Grek"
+
+# (language subtag, script subtag) pairs supported by each romanization engine
+_ARABIC2LATIN_PAIRS = frozenset(
+    {
+        ("ar", "Arab"),  # Arabic
+        ("fa", "Arab"),  # Persian
+    }
+)
+_IULIIA_PAIRS = frozenset(
+    {
+        ("ab", "Cyrl"),  # Abkhazian
+        ("be", "Cyrl"),  # Belarussian
+        ("bg", "Cyrl"),  # Bulgarian
+        ("kk", "Cyrl"),  # Kazakh
+        ("mk", "Cyrl"),  # Macedonian
+        ("ru", "Cyrl"),  # Russian
+        ("uk", "Cyrl"),  # Ukrainian
+        ("uz", "Cyrl"),  # Uzbek
+        ("uzn", "Cyrl"),  # Northern Uzbek
+        ("uzs", "Cyrl"),  # Southern Uzbek
+    }
+)
+_SCHIZAS_PAIRS = frozenset({("el", "Grek")})  # Modern Greek
+_MANNINEN_PAIRS = frozenset(
+    {
+        ("grc", "Grek"),  # Ancient Greek (to 1453)
+        ("hy", "Armn"),  # Armenian (ISO 639-2 "arm")
+        ("syc", "Syrc"),  # Classical Syriac
+        ("ar", "Arab"),  # Arabic (ISO 639-2 "ara")
+        ("phn", "Phnx"),  # Phoenician
+        ("brh", "Brah"),  # romanize3 "brh" module, which handles Brahmi script
+        ("cop", "Copt"),  # Coptic
+        ("hbo", "Hebr"),  # Ancient Hebrew (ISO 639-2 "heb")
+    }
+)
+_YUCONV_PAIRS = frozenset({("sr", "Cyrl")})  # Serbian
+_ENGINE_PAIRS = {
+    "arabic2latin": _ARABIC2LATIN_PAIRS,
+    "iuliia": _IULIIA_PAIRS,
+    "romanize-schizas": _SCHIZAS_PAIRS,
+    "romanize-manninen": _MANNINEN_PAIRS,
+    "yuconv": _YUCONV_PAIRS,
+}
+# registry fields that are expected in language and script entries but not used
+_IGNORED_LANGUAGE_FIELDS = frozenset(
+    {
+        "Added",
+        "Comments",
+        "Description",
+        "Scope",
+        "Macrolanguage",
+        "Deprecated",
+        "Preferred-Value",
+    }
+)
+_IGNORED_SCRIPT_FIELDS = frozenset({"Added", "Comments"})
+
+
+def _fold_field(value: str) -> str:
+    """
+    Join a registry field value with its continuation lines, which are indented by two spaces.
+    """
+    return value.replace("\n  ", " ")
+
+
+def _is_latin_script(text: str) -> bool:
+    """
+    Check that Latin is the only script detected in the text.
+
+    Args:
+        text (str): The text to check.
+    Returns:
+        bool: True if the text contains Latin letters and no letters of any other specific script.
+    Notes:
+        Gives the same answer as ScriptDetector.detect_scripts(text) == ("Latn",), but without
+        building any sets; letters are checked against a precomputed set of Latin letters, and
+        other characters against the memoized code point to script map.
+    """
+    if text.isascii():
+        return any(c.isalpha() for c in text)
+    has_latin = False
+    for c in text:
+        if c in _LATIN_LETTERS:
+            has_latin = True
+        elif _SCRIPT_BY_CODEPOINT[ord(c)] is not None:
+            # a letter of some other specific script
+            return False
+    return has_latin
+
+
+def _is_plain_ascii(text: str) -> bool:
+    """
+    Check that the text is ASCII letters and digits, with words separated by single spaces.
+    """
+    return text.isascii() and all(map(str.isalnum, text.split(" ")))
+
+
+@lru_cache(maxsize=1024)
+def _validate_tag(tag: str) -> str | None:
+    """
+    Memoized validation and standardization of a BCP 47 language tag.
+
+    Returns:
+        str | None: The standardized tag, or None if the tag is not valid.
+    """
+    if not langcodes.tag_is_valid(tag):
+        return None
+    return _standardize_tag(tag)
+
+
+@lru_cache(maxsize=1024)
+def _standardize_tag(tag: str) -> str:
+    """
+    Memoized langcodes.standardize_tag.
+    """
+    return langcodes.standardize_tag(tag)
+
+
+@lru_cache(maxsize=1024)
+def _std_tag(lang_subtag: str, script_subtag: str) -> str:
+    """
+    Memoized standardized language tag composed from a language and a script subtag.
+    """
+    return _standardize_tag(f"{lang_subtag}-{script_subtag}")
+
+
+@lru_cache(maxsize=1024)
+def _lang_get(tag: str) -> langcodes.Language:
+    """
+    Memoized langcodes.Language.get.
+    """
+    return langcodes.Language.get(tag)
+
+
+@lru_cache(maxsize=1024)
+def _likely_script(tag: str) -> str | None:
+    """
+    Memoized script subtag called for by a language tag: its own script subtag if it has one,
+    or else the most likely script for the language per CLDR (Greek for Ancient Greek).
+    """
+    lang = _lang_get(tag)
+    if lang.language == "grc":
+        return _GRC_SCRIPT
+    return lang.script or lang.maximize().script
+
+
+def _sampled_script(text: str, expected_script: str | None) -> str | None:
+    """
+    Check a sample of about eight characters of the text against the expected script.
+
+    Returns:
+        str | None: The expected script if every letter in the sample (and at least one) is in
+        it, otherwise None.
+    """
+    if expected_script is None:
+        return None
+    # one pass, stopping at the first letter of another script
+    found = False
+    sample = text[:: max(1, len(text) // 8)]
+    for script in map(_SCRIPT_BY_CODEPOINT.__getitem__, map(ord, sample)):
+        if script == expected_script:
+            found = True
+        elif script is not None:
+            return None
+    return expected_script if found else None
+
+
+class _ScriptByCodepoint(dict):
+    """
+    Code point to script code for letters (None for other characters), filled in on first lookup.
+    """
+
+    def __missing__(self, cp: int) -> str | None:
+        script = None
+        if chr(cp).isalpha():
+            script = _SCRIPTS[bisect_right(_STARTS, cp) - 1]
+            if script in _NON_SPECIFIC_SCRIPTS:
+                script = None
+        self[cp] = script
+        return script
+
+
+_SCRIPT_BY_CODEPOINT = _ScriptByCodepoint()
+
+
+class _Resolution(NamedTuple):
+    """
+    Language and script resolved for a text by Romanizer._resolve.
+    """
+
+    lang_tags: str
+    source_language: str
+    source_script: str
+    # standardized tag composed of source_language and source_script, as reported by engines
+    source_lang_tag: str
 
 
 class RomanizationUnsupportedLanguageError(Exception):
@@ -33,22 +253,25 @@ class RomanizationUnsupportedLanguageError(Exception):
         super().__init__(message)
 
 
+@dataclass(slots=True, frozen=True)
 class RomanString:
     """
     A class to represent romanized text along with its metadata.
     """
 
-    def __init__(
-        self,
-        original_text: str,
-        original_lang_tag: str,
-        romanized_form: str,
-        engine: str,
-    ):
-        self.original = original_text
-        self.original_lang_tag = original_lang_tag
-        self.romanized = romanized_form
-        self.engine = engine
+    # instances are held in the romanize caches, so keep them small; the language tag and
+    # engine name come from a handful of values and are interned to share one copy each
+    original: str
+    original_lang_tag: str
+    romanized: str
+    engine: str
+
+    def __post_init__(self):
+        # frozen, so bypass the generated __setattr__ guard
+        object.__setattr__(
+            self, "original_lang_tag", sys.intern(self.original_lang_tag)
+        )
+        object.__setattr__(self, "engine", sys.intern(self.engine))
 
     def __str__(self):
         return f"RomanString({self.romanized} from {self.original} ({self.original_lang_tag}) via {self.engine})"
@@ -57,12 +280,84 @@ class RomanString:
         return str(self)
 
 
+# keywords taken by the hand-written __init__ that RomanString used to have
+_ROMANSTRING_LEGACY_KEYWORDS = {
+    "original_text": "original",
+    "romanized_form": "romanized",
+}
+_romanstring_dataclass_init = RomanString.__init__
+
+
+@wraps(_romanstring_dataclass_init)
+def _romanstring_init(self, *args, **kwargs):
+    for legacy, field in _ROMANSTRING_LEGACY_KEYWORDS.items():
+        if legacy in kwargs:
+            warnings.warn(
+                f"RomanString keyword '{legacy}' is deprecated; use '{field}' instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if field in kwargs:
+                raise TypeError(
+                    f"RomanString got both '{legacy}' and '{field}' for the same field"
+                )
+            kwargs[field] = kwargs.pop(legacy)
+    _romanstring_dataclass_init(self, *args, **kwargs)
+
+
+RomanString.__init__ = _romanstring_init
+
+
 class Romanizer:
     """
     A class to handle romanization of various writing systems.
     """
 
-    def __init__(self, use_engines: list | str = "all"):
+    def __init__(
+        self,
+        use_engines: list | str = "all",
+        max_workers: int | None = None,
+        ascii_fast_path: bool = False,
+        trust_language_tag: bool = False,
+    ):
+        """
+        Args:
+            use_engines (list | str): Names of the engines to use, or "all" (the default).
+            max_workers (int | None): If set, run the engines for each text (or, in
+                romanize_many, each group of texts) concurrently on a thread pool of this size.
+                Most engines are pure Python and hold the GIL, so this only pays off on
+                free-threaded builds; by default engines run sequentially. Call close(), or use
+                the Romanizer as a context manager, to shut the pool down.
+            ascii_fast_path (bool): If True, return ASCII text made up only of letters, digits
+                and single spaces as its own ("identity") romanization without running any
+                engine. The language tags are still validated and checked against the script.
+            trust_language_tag (bool): If True, check text with a defined language tag against
+                the script the tag calls for by sampling about eight of its characters, rather
+                than detecting the scripts of all of them. If the sample does not match, the
+                scripts are detected in full as usual. Letters of other scripts that fall
+                between the sampled characters go unnoticed, so mixed-script text that would
+                otherwise be skipped (romanize returns []) may be romanized as if it were all
+                in the expected script.
+        """
+        # the engine packages are slow to import, so import them here rather than at module
+        # level, where they would be loaded by anything importing e.g. RomanString
+        from arabic2latin import arabic_to_latin
+        import iuliia
+        from romanize import romanize as romanize_schizas
+        import romanize3 as romanize_manninen
+        import slugify as python_slugify
+        from yuconv import YuConverter
+        from yuconv import TransliterationMode as YuConvTransliterationMode
+
+        self._arabic_to_latin = arabic_to_latin
+        self._romanize_schizas = romanize_schizas
+        self._romanize_manninen = romanize_manninen
+        # slugify ignores the language tag, so the same text under different tags (or tried
+        # again after a romanize cache eviction) is slugified once
+        self._slugify = lru_cache(maxsize=4096)(
+            partial(python_slugify.slugify, separator=" ", lowercase=False)
+        )
+
         # Initialize any necessary data structures or mappings here
         self._engines = {
             "arabic2latin": self._romanize_with_arabic2latin,  # "arabic2latin" by rexa222: https://pypi.org/project/arabic2latin/
@@ -93,10 +388,62 @@ class Romanizer:
                     )
                 else:
                     self.use_engines.append(engine)
-        self._script_detector = ScriptDetector()
+        # (name, bound method) pairs of engines to try for each (language subtag, script
+        # subtag) pair, in use_engines order; engines without a pair table (python-slugify)
+        # apply to any pair
+        self._universal_engines = tuple(
+            (engine, self._engines[engine])
+            for engine in self.use_engines
+            if engine not in _ENGINE_PAIRS
+        )
+        self._engines_for = dict()
+        for pair in frozenset().union(*_ENGINE_PAIRS.values()):
+            self._engines_for[pair] = tuple(
+                (engine, self._engines[engine])
+                for engine in self.use_engines
+                if engine not in _ENGINE_PAIRS or pair in _ENGINE_PAIRS[engine]
+            )
+        self._und_engines = (("python-slugify", self._romanize_with_python_slugify),)
+        if max_workers is None:
+            self._pool = None
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._script_detector = _shared_script_detector()
+        # cache per instance rather than decorating the method, which would key on (and keep
+        # alive) self
+        self._resolve = lru_cache(maxsize=50000)(self._resolve)
+        self._romanize_cache = dict()
+        self._ascii_fast_path = ascii_fast_path
+        self._trust_language_tag = trust_language_tag
         d = {"ή": "ḗ", "ي": "i"}
         self._manninen_substitutions = str.maketrans(d)
         self._yuconverter = YuConverter()
+        self._yuconv_mode = YuConvTransliterationMode().CyrillicToLatin
+        # iuliia schemas to apply: "uz" only for Uzbek, all others for Russian, and all others
+        # but the Moscow Metro ("mosmetro") schema for other languages
+        self._iuliia_uz = (iuliia.schemas.get("uz"),)
+        self._iuliia_ru = tuple(
+            schema for name, schema in iuliia.schemas.items() if name != "uz"
+        )
+        self._iuliia_other = tuple(
+            schema
+            for name, schema in iuliia.schemas.items()
+            if name not in {"uz", "mosmetro"}
+        )
+
+    def close(self):
+        """
+        Shut down the thread pool, if any, waiting for running engines to finish.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
     def engines(self):
@@ -105,7 +452,6 @@ class Romanizer:
         """
         return list(self._engines.keys())
 
-    @lru_cache(maxsize=5000)
     def romanize(
         self, text: str, lang_tags: str = "und", omit_engines: tuple = ()
     ) -> list[RomanString]:
@@ -115,37 +461,269 @@ class Romanizer:
         Args:
             text (str): The input text in its original script.
             langtags (str): IANA language tags to guide romanization (default is "und" for undefined).
+            omit_engines (tuple): Names of engines not to use for this text.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             This method applies all available romanization engines to the input text and
-            aggregates the results.
+            aggregates the results. The text is normalized to Unicode NFC before romanization,
+            so results are cached (and their "original" attribute reported) in NFC form.
+        """
+        text = unicodedata.normalize("NFC", text)
+        key = (text, lang_tags, omit_engines)
+        romanizations = self._romanize_cache.get(key)
+        if romanizations is None:
+            romanizations = self._romanize_nfc(text, lang_tags, omit_engines)
+            self._cache_romanizations(key, romanizations)
+        return romanizations
+
+    def _cache_romanizations(self, key: tuple, romanizations: list[RomanString]):
+        """
+        Store romanized forms under a (text, lang_tags, omit_engines) key.
+        """
+        cache = self._romanize_cache
+        cache[key] = romanizations
+        if len(cache) > _ROMANIZE_CACHE_SIZE:
+            # evict the oldest entry
+            del cache[next(iter(cache))]
+
+    def _romanize_nfc(
+        self, text: str, lang_tags: str, omit_engines: tuple
+    ) -> list[RomanString]:
+        """
+        Romanize NFC-normalized text, without caching; see romanize().
+        """
+        resolution = self._resolve(text, lang_tags)
+        if resolution is None:
+            return []
+        if self._ascii_fast_path and _is_plain_ascii(text):
+            return self._with_identity(text, resolution, [])
+        engines = self._engines_to_run(resolution, omit_engines)
+        if self._pool is not None and len(engines) > 1:
+            futures = [
+                self._pool.submit(
+                    self._run_engine, engine_name, engine, text, resolution
+                )
+                for engine_name, engine in engines
+            ]
+            # collect results in engine order, not completion order
+            results = [future.result() for future in futures]
+        else:
+            results = [
+                self._run_engine(engine_name, engine, text, resolution)
+                for engine_name, engine in engines
+            ]
+        romanizations = [r for romanized_forms in results for r in romanized_forms]
+        return self._with_identity(text, resolution, romanizations)
+
+    def romanize_many(
+        self,
+        items: Iterable[str | tuple[str, str]],
+        lang_tags: str = "und",
+        omit_engines: tuple = (),
+    ) -> dict[tuple[str, str], list[RomanString]]:
         """
-        logger = logging.getLogger(__name__)
+        Romanize many texts.
 
-        logger.debug(f"lang_tags as input: {lang_tags}")
+        Args:
+            items (Iterable[str | tuple[str, str]]): Texts, or (text, lang_tags) pairs as would be
+                passed to romanize().
+            lang_tags (str): IANA language tags for items given as bare texts (default is "und").
+            omit_engines (tuple): Names of engines not to use for any of the texts.
+        Returns:
+            dict[tuple[str, str], list[RomanString]]: The romanized forms for each distinct
+            (text, lang_tags) pair in "items", in the order first seen.
+        Notes:
+            Results are the same as calling romanize() on each pair, and share its cache.
+            Duplicate pairs are romanized once, and texts that resolve to the same language
+            and script are passed through each applicable engine together. All the language
+            tags are validated before any text is romanized.
+        """
+        results = dict.fromkeys(
+            (item, lang_tags) if isinstance(item, str) else tuple(item)
+            for item in items
+        )
+        for item_tags in dict.fromkeys([lang_tags, *(tags for _, tags in results)]):
+            if _validate_tag(item_tags) is None:
+                raise ValueError(f"Invalid BCP 47 language tag(s) '{item_tags}'")
+        # romanized forms by cache key; None while a key's group is still to be romanized
+        romanized = dict()
+        groups = dict()
+        for item in results:
+            text, item_tags = item
+            text = unicodedata.normalize("NFC", text)
+            key = (text, item_tags, omit_engines)
+            results[item] = key
+            if key in romanized:
+                continue
+            romanized[key] = self._romanize_cache.get(key)
+            if romanized[key] is not None:
+                continue
+            resolution = self._resolve(text, item_tags)
+            if resolution is None:
+                romanized[key] = []
+            elif self._ascii_fast_path and _is_plain_ascii(text):
+                romanized[key] = self._with_identity(text, resolution, [])
+            else:
+                groups.setdefault(resolution, []).append((key, text))
+                continue
+            self._cache_romanizations(key, romanized[key])
+        for resolution, members in groups.items():
+            romanizations = {key: [] for key, _ in members}
+            engines = self._engines_to_run(resolution, omit_engines)
+            if self._pool is not None and len(engines) > 1:
+                futures = [
+                    self._pool.submit(
+                        self._run_engine_on_members,
+                        engine_name,
+                        engine,
+                        members,
+                        resolution,
+                    )
+                    for engine_name, engine in engines
+                ]
+                # collect results in engine order, not completion order
+                results_by_engine = [future.result() for future in futures]
+            else:
+                results_by_engine = [
+                    self._run_engine_on_members(
+                        engine_name, engine, members, resolution
+                    )
+                    for engine_name, engine in engines
+                ]
+            for engine_results in results_by_engine:
+                for (key, _), romanized_forms in zip(members, engine_results):
+                    romanizations[key].extend(romanized_forms)
+            for key, text in members:
+                romanized[key] = self._with_identity(
+                    text, resolution, romanizations[key]
+                )
+                self._cache_romanizations(key, romanized[key])
+        return {item: romanized[key] for item, key in results.items()}
+
+    def _engines_to_run(self, resolution: _Resolution, omit_engines: tuple) -> tuple:
+        """
+        Select the (name, bound method) pairs of engines to apply to text with a given
+        language and script.
+        """
+        if resolution.lang_tags[:3] == "und":
+            # use only python-slugify for undefined language tags
+            return self._und_engines
+        engines = self._engines_for.get(
+            (resolution.source_language, resolution.source_script),
+            self._universal_engines,
+        )
+        if not omit_engines:
+            return engines
+        selected = list()
+        for engine_name, engine in engines:
+            if engine_name in omit_engines:
+                _logger.debug("skipping engine '%s' per omit_engines", engine_name)
+                continue
+            selected.append((engine_name, engine))
+        return tuple(selected)
+
+    def _run_engine(
+        self, engine_name: str, engine, text: str, resolution: _Resolution
+    ) -> list[RomanString]:
+        """
+        Romanize the text with one engine, logging (rather than raising) unsupported languages.
+        """
+        try:
+            return engine(
+                text,
+                lang_subtag=resolution.source_language,
+                script_subtag=resolution.source_script,
+                lang_tag=resolution.source_lang_tag,
+            )
+        except RomanizationUnsupportedLanguageError as err:
+            _logger.error(
+                "Romanization engine '%s' failed for text '%s' with langtag '%s' (source_language: '%s', source_script: '%s'): %s",
+                engine_name,
+                text,
+                resolution.lang_tags,
+                resolution.source_language,
+                resolution.source_script,
+                err,
+            )
+            return []
+
+    def _run_engine_on_members(
+        self, engine_name: str, engine, members: list, resolution: _Resolution
+    ) -> list[list[RomanString]]:
+        """
+        Romanize each (key, text) member of a romanize_many group with one engine.
+        """
+        return [
+            self._run_engine(engine_name, engine, text, resolution)
+            for _, text in members
+        ]
+
+    def _with_identity(
+        self, text: str, resolution: _Resolution, romanizations: list[RomanString]
+    ) -> list[RomanString]:
+        """
+        Add the original text as a romanization if it's already in Latin script.
+        """
+        if resolution.source_script == "Latn":
+            if text not in [r.romanized for r in romanizations]:
+                romanizations.append(
+                    RomanString(
+                        original=text,
+                        original_lang_tag=resolution.lang_tags,
+                        romanized=text,
+                        engine="identity",
+                    )
+                )
+        return romanizations
+
+    def _resolve(self, text: str, lang_tags: str) -> _Resolution | None:
+        """
+        Work out the language and script of NFC-normalized text before romanizing it.
+
+        Args:
+            text (str): The input text in its original script.
+            lang_tags (str): IANA language tags to guide romanization.
+        Returns:
+            _Resolution | None: The standardized (or guessed) language tags and the source language
+            and script subtags, or None if the text cannot be romanized (more or fewer than one
+            script detected, or a script that does not match the language tags).
+        Notes:
+            Romanizer.__init__ wraps this method in a per-instance lru_cache, so that the
+            resolution is reused even when the romanize result itself has been evicted.
+        """
+        _logger.debug("lang_tags as input: %s", lang_tags)
         # validate and standardize the lang tag
-        if not langcodes.tag_is_valid(lang_tags):
+        standardized_lang_tag = _validate_tag(lang_tags)
+        if standardized_lang_tag is None:
             raise ValueError(
                 f"Invalid BCP 47 language tag(s) '{lang_tags}' for text '{text}'"
             )
-        standardized_lang_tag = langcodes.standardize_tag(lang_tags)
         if standardized_lang_tag != lang_tags:
-            logger.warning(
-                f"Non-standard BCP 47 language tag '{lang_tags}' replaced with standardized tag '{standardized_lang_tag}'"
+            _logger.warning(
+                "Non-standard BCP 47 language tag '%s' replaced with standardized tag '%s'",
+                lang_tags,
+                standardized_lang_tag,
             )
             lang_tags = standardized_lang_tag
-        logger.debug(f"standardized lang_tags: {lang_tags}")
+        _logger.debug("standardized lang_tags: %s", lang_tags)
 
-        # detect the script(s) used in the input text
-        actual_scripts = self._script_detector.detect_scripts(text)
-        if len(actual_scripts) != 1:
-            logger.error(
-                f"Detected {len(actual_scripts)} scripts in text '{text}'; skipping romanization"
-            )
-            return []
-        source_script = actual_scripts[0]
-        logger.debug(f"source_script: {source_script}")
+        # detect the script(s) used in the input text, unless trusting the lang tag and a
+        # sample of the text bears it out
+        source_script = None
+        if self._trust_language_tag and lang_tags != "und":
+            source_script = _sampled_script(text, _likely_script(lang_tags))
+        if source_script is None:
+            actual_scripts = self._script_detector.detect_scripts(text)
+            if len(actual_scripts) != 1:
+                _logger.error(
+                    "Detected %d scripts in text '%s'; skipping romanization",
+                    len(actual_scripts),
+                    text,
+                )
+                return None
+            source_script = actual_scripts[0]
+        _logger.debug("source_script: %s", source_script)
 
         # try to guess the language tag on the basis of script if undefined
         if lang_tags == "und":
@@ -154,67 +732,42 @@ class Romanizer:
             )
             if len(candidates) == 1:
                 lang_tags = list(candidates)[0]
-                logger.debug(
-                    f"Guessed language tag '{lang_tags}' for script '{source_script}'"
+                _logger.debug(
+                    "Guessed language tag '%s' for script '%s'",
+                    lang_tags,
+                    source_script,
                 )
 
         # if we think we know the real language tag, check that the script matches expectations
         if lang_tags != "und":
             expected_script = None
-            lang = langcodes.Language.get(lang_tags)
+            lang = _lang_get(lang_tags)
             if lang.language == "grc":
-                expected_script = "Grek"  # not included in langcodes default scripts
+                expected_script = _GRC_SCRIPT
             else:
                 expected_script = lang.script
             if source_script != expected_script and expected_script is not None:
-                logger.error(
-                    f"Detected script '{source_script}' in text '{text}' does not match expected script '{expected_script}' for langtag '{lang_tags}; skipping romanization'"
+                _logger.error(
+                    "Detected script '%s' in text '%s' does not match expected script '%s' for langtag '%s'; skipping romanization",
+                    source_script,
+                    text,
+                    expected_script,
+                    lang_tags,
                 )
-                return []
+                return None
             source_language = lang.language
         else:
             source_language = "und"
-        logger.debug(f"source_language: {source_language}")
-
-        # perform romanization using all appropriate engines
-        romanizations = list()
-        if lang_tags.startswith("und"):
-            # use only python-slugify for undefined language tags
-            romanizations = self._engines["python-slugify"](
-                text, lang_subtag=source_language, script_subtag=source_script
-            )
-        else:
-            for engine_name in self.use_engines:
-                if engine_name in omit_engines:
-                    logger.debug(f"skipping engine '{engine_name}' per omit_engines")
-                    continue
-                engine_func = self._engines[engine_name]
-                try:
-                    romanized_forms = engine_func(
-                        text, lang_subtag=source_language, script_subtag=source_script
-                    )
-                except RomanizationUnsupportedLanguageError as err:
-                    logger.error(
-                        f"Romanization engine '{engine_name}' failed for text '{text}' with langtag '{lang_tags}' (source_language: '{source_language}', source_script: '{source_script}'): {err}"
-                    )
-                else:
-                    romanizations.extend(romanized_forms)
-        if source_script == "Latn":
-            # include the original text as a romanization if it's already in Latin script
-            if text not in [r.romanized for r in romanizations]:
-                romanizations.append(
-                    RomanString(
-                        original_text=text,
-                        original_lang_tag=lang_tags,
-                        romanized_form=text,
-                        engine="identity",
-                    )
-                )
-        return romanizations
+        _logger.debug("source_language: %s", source_language)
+        return _Resolution(
+            lang_tags,
+            source_language,
+            source_script,
+            _std_tag(source_language, source_script),
+        )
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_arabic2latin(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the arabic2latin engine.
@@ -223,38 +776,28 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             The arabic2latin engine is used to produce one and only one romanized form using its
             internal algorithm. No information about language or script is passed to the engine.
         """
-        langtags = langcodes.standardize_tag(f"{lang_subtag}-{script_subtag}")
-        supported_lang_subtags = {
-            "ar",  # Arabic
-            "fa",  # Persian
-        }
-        supported_script_subtags = {"Arab"}
-        if not (
-            lang_subtag in supported_lang_subtags
-            and script_subtag in supported_script_subtags
-        ):
+        if (lang_subtag, script_subtag) not in _ARABIC2LATIN_PAIRS:
             raise RomanizationUnsupportedLanguageError(
-                f"Unsupported language/script for arabic2latin engine: {langtags}"
+                f"Unsupported language/script for arabic2latin engine: {lang_tag}"
             )
-
         return [
             RomanString(
-                original_text=text,
-                original_lang_tag=langtags,
-                romanized_form=arabic_to_latin(text),
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=self._arabic_to_latin(text),
                 engine="arabic2latin",
             )
         ]
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_iuliia(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the iuliia engine.
@@ -263,64 +806,37 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             The iuliia engine is used to produce one and only one romanized form using its
             internal algorithm. No information about language or script is passed to the engine.
         """
-        langtags = langcodes.standardize_tag(f"{lang_subtag}-{script_subtag}")
-        supported_lang_subtags = {
-            "ab",  # Abkhazian
-            "be",  # Belarussian
-            "bg",  # Bulgarian
-            "kk",  # Kazakh
-            "mk",  # Macedonian
-            "ru",  # Russian
-            "uk",  # Ukrainian
-            "uz",  # Uzbek
-            "uzn",  # Northern Uzbek
-            "uzs",  # Southern Uzbek
-        }
-        supported_script_subtags = {"Cyrl"}
-        if not (
-            lang_subtag in supported_lang_subtags
-            and script_subtag in supported_script_subtags
-        ):
+        if (lang_subtag, script_subtag) not in _IULIIA_PAIRS:
             raise RomanizationUnsupportedLanguageError(
-                f"Unsupported language/script for iuliia engine: {langtags}"
+                f"Unsupported language/script for iuliia engine: {lang_tag}"
             )
         if lang_subtag in {"uz", "uzn", "uzs"}:
-            schema = iuliia.schemas.get("uz")
-            return [
-                RomanString(
-                    original_text=text,
-                    original_lang_tag=langtags,
-                    romanized_form=schema.translate(text),
-                    engine="iuliia",
-                )
-            ]
+            schemas = self._iuliia_uz
+        elif lang_subtag == "ru":
+            schemas = self._iuliia_ru
         else:
-            romanized_forms = set()
-            for name, schema in iuliia.schemas.items():
-                if name == "uz":
-                    continue
-                if lang_subtag != "ru" and name == "mosmetro":
-                    continue
-                romanized_forms.add(schema.translate(text))
-            return [
-                RomanString(
-                    original_text=text,
-                    original_lang_tag=langtags,
-                    romanized_form=rf,
-                    engine="iuliia",
-                )
-                for rf in romanized_forms
-            ]
+            schemas = self._iuliia_other
+        # dict keys dedupe identical outputs from different schemas, keeping first-seen order
+        romanized_forms = dict.fromkeys(schema.translate(text) for schema in schemas)
+        return [
+            RomanString(
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=rf,
+                engine="iuliia",
+            )
+            for rf in romanized_forms
+        ]
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_python_slugify(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the python-slugify engine.
@@ -329,6 +845,7 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
@@ -338,20 +855,15 @@ class Romanizer:
 
         return [
             RomanString(
-                original_text=text,
-                original_lang_tag=langcodes.standardize_tag(
-                    f"{lang_subtag}-{script_subtag}"
-                ),
-                romanized_form=python_slugify.slugify(
-                    text, separator=" ", lowercase=False
-                ),
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=self._slugify(text),
                 engine="python-slugify",
             )
         ]
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_romanize_schizas(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the romanize engine.
@@ -360,37 +872,29 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             The romanize engine is used to produce one and only one romanized form using its
             internal algorithm. No information about language or script is passed to the engine.
         """
-        langtags = langcodes.standardize_tag(f"{lang_subtag}-{script_subtag}")
-        supported_lang_subtags = {"el"}
-        supported_script_subtags = {"Grek"}
-        if (
-            lang_subtag in supported_lang_subtags
-            and script_subtag in supported_script_subtags
-        ):
-            romanized_text = romanize_schizas(text)
-            return [
-                RomanString(
-                    original_text=text,
-                    original_lang_tag=langtags,
-                    romanized_form=romanized_text,
-                    engine="romanize-schizas",
-                )
-            ]
-        else:
+        if (lang_subtag, script_subtag) not in _SCHIZAS_PAIRS:
             raise RomanizationUnsupportedLanguageError(
-                f"Unsupported language/script for romanize engine: {langtags}"
+                f"Unsupported language/script for romanize engine: {lang_tag}"
             )
-        return []
+        romanized_text = self._romanize_schizas(text)
+        return [
+            RomanString(
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=romanized_text,
+                engine="romanize-schizas",
+            )
+        ]
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_romanize_manninen(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the romanize3 engine.
@@ -399,74 +903,46 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             The romanize3 engine is used to produce one and only one romanized form using its
             internal algorithm. No information about language or script is passed to the engine.
         """
-        langtags = langcodes.standardize_tag(f"{lang_subtag}-{script_subtag}")
-        supported_lang_subtags = {
-            "grc",  # Ancient Greek (to 1453)
-            "hy",  # Armenian (ISO 639-2 "arm")
-            "syc",  # Classical Syriac
-            "ar",  # Arabic (ISO 639-2 "ara")
-            "phn",  # Phoenician
-            "brh",  # Brahui
-            "cop",  # Coptic
-            "hbo",  # Ancient Hebrew (ISO 639-2 "heb")
-        }
-        supported_script_subtags = {
-            "Grek",
-            "Armn",
-            "Syrc",
-            "Arab",
-            "Phnx",
-            "Brah",
-            "Copt",
-            "Hebr",
-        }
-        if (
-            lang_subtag in supported_lang_subtags
-            and script_subtag in supported_script_subtags
-        ):
-            if lang_subtag == "ar":
-                r = romanize_manninen.__dict__["ara"]
-            elif lang_subtag == "hy":
-                r = romanize_manninen.__dict__["arm"]
-            elif lang_subtag == "heb":
-                r = romanize_manninen.__dict__["hbo"]
-            else:
-                r = romanize_manninen.__dict__[lang_subtag]
-            romanized_text = r.convert(text)
-            # this package sometimes uses non-Roman characters in its output
-            if self._script_detector.detect_scripts(romanized_text) != ["Latn"]:
-                romanized_text = romanized_text.translate(self._manninen_substitutions)
-                if self._script_detector.detect_scripts(romanized_text) != ["Latn"]:
-                    raise RuntimeError(
-                        f"romanize3 (manninen) engine produced non-Latin script output for language/script {langtags}: {romanized_text}"
-                    )
-            if "h" in romanized_text[1:] and romanized_text[0].lower() != "t":
-                romanized_text = romanized_text[0] + romanized_text[1:].replace(
-                    "h", "th"
-                )
-            return [
-                RomanString(
-                    original_text=text,
-                    original_lang_tag=langtags,
-                    romanized_form=romanized_text,
-                    engine="romanize-manninen",
-                )
-            ]
-        else:
+        if (lang_subtag, script_subtag) not in _MANNINEN_PAIRS:
             raise RomanizationUnsupportedLanguageError(
-                f"Unsupported language/script for romanize-manninen (romanize3) engine: {langtags}"
+                f"Unsupported language/script for romanize-manninen (romanize3) engine: {lang_tag}"
+            )
+        if lang_subtag == "ar":
+            r = self._romanize_manninen.__dict__["ara"]
+        elif lang_subtag == "hy":
+            r = self._romanize_manninen.__dict__["arm"]
+        elif lang_subtag == "hbo":
+            r = self._romanize_manninen.__dict__["heb"]
+        else:
+            r = self._romanize_manninen.__dict__[lang_subtag]
+        romanized_text = r.convert(text)
+        # this package sometimes uses non-Roman characters in its output
+        if not _is_latin_script(romanized_text):
+            romanized_text = romanized_text.translate(self._manninen_substitutions)
+            if not _is_latin_script(romanized_text):
+                raise RuntimeError(
+                    f"romanize3 (manninen) engine produced non-Latin script output for language/script {lang_tag}: {romanized_text}"
+                )
+        if romanized_text[:1].lower() != "t":
+            romanized_text = _H_AFTER_FIRST_RE.sub("th", romanized_text)
+        return [
+            RomanString(
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=romanized_text,
+                engine="romanize-manninen",
             )
-        return []
+        ]
 
-    @lru_cache(maxsize=5000)
     def _romanize_with_yuconv(
-        self, text: str, lang_subtag: str, script_subtag: str
+        self, text: str, lang_subtag: str, script_subtag: str, lang_tag: str
     ) -> list[RomanString]:
         """
         Romanize the input text using the yuconv engine for Serbian Cyrillic.
@@ -475,38 +951,27 @@ class Romanizer:
             text (str): The input text in its original script.
             lang_subtag (str): IANA language subtag for reporting.
             script_subtag (str): IANA script subtag for reporting.
+            lang_tag (str): Standardized language tag composed of the two subtags, for reporting.
         Returns:
             list[RomanString]: A list containing one or more romanized forms of the input "text" string.
         Notes:
             The yuconv engine is used to produce one and only one romanized form using its
             internal algorithm.
         """
-        langtags = langcodes.standardize_tag(f"{lang_subtag}-{script_subtag}")
-        supported_lang_subtags = {
-            "sr",  # Serbian
-        }
-        supported_script_subtags = {
-            "Cyrl",
-        }
-        if (
-            lang_subtag in supported_lang_subtags
-            and script_subtag in supported_script_subtags
-        ):
-            converter = self._yuconverter
-            mode = YuConvTransliterationMode().CyrillicToLatin
-            return [
-                RomanString(
-                    original_text=text,
-                    original_lang_tag=langtags,
-                    romanized_form=converter.transliterate_text(text, mode),
-                    engine="yuconv",
-                )
-            ]
-        else:
+        if (lang_subtag, script_subtag) not in _YUCONV_PAIRS:
             raise RomanizationUnsupportedLanguageError(
-                f"Unsupported language/script for yuconv engine: {langtags}"
+                f"Unsupported language/script for yuconv engine: {lang_tag}"
+            )
+        converter = self._yuconverter
+        mode = self._yuconv_mode
+        return [
+            RomanString(
+                original=text,
+                original_lang_tag=lang_tag,
+                romanized=converter.transliterate_text(text, mode),
+                engine="yuconv",
             )
-        return []
+        ]
 
 
 class ScriptDetector:
@@ -514,143 +979,291 @@ class ScriptDetector:
     A class to detect the script(s) used in a given text.
     """
 
-    def __init__(self):
+    # language and script records in the registry, each running up to the next "%%" separator
+    _entry_re = re.compile(r"^Type: (language|script)\n((?:[^%\n].*\n?)*)", re.M)
+    # "Field-Name: value" lines within a record, with any continuation lines (indented by two
+    # spaces) that follow; fold them into the value with _fold_field
+    _field_re = re.compile(r"^([A-Za-z-]+): (.*(?:\n  .*)*)", re.M)
+
+    # tables parsed from the registry, loaded on first access once per process and shared by
+    # all instances using the same cache file (keyed by its path in _shared_registries)
+    _registry_tables = (
+        "scripts_by_description",
+        "scripts_by_subtag",
+        "languages_by_script",
+    )
+    _shared_registries = dict()
+
+    def __init__(self, cache_dir: Path | str | None = None):
+        """
+        Args:
+            cache_dir (Path | str | None): Directory in which to cache the tables parsed from
+                the IANA Language Subtag Registry between runs (default is the user cache
+                directory for pleiades_writing_systems).
+        Notes:
+            Only the registry tables are cached on disk. Detected scripts are cached in memory
+            only: looking them up in the range table is several times faster than reading
+            them back from a disk cache.
+        """
+        if cache_dir is None:
+            from platformdirs import user_cache_dir
+
+            cache_dir = user_cache_dir("pleiades_writing_systems")
+        self._scripts_cache = dict()
+        self._charsets_cache = dict()
+        self._parsed_registry_path = Path(cache_dir) / "registry-2.pkl"
+
+    def __getattr__(self, name: str):
+        """
+        Load the registry tables on first access; detect_scripts does not need them.
+        """
+        if name not in self._registry_tables:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        self._load_registry()
+        return self.__dict__[name]
+
+    def _load_registry(self):
+        """
+        Bind the registry tables shared by instances with the same cache file, loading them
+        first if need be.
+        """
+        shared = ScriptDetector._shared_registries.get(self._parsed_registry_path)
+        if shared is None:
+            self.scripts_by_description = dict()
+            self.scripts_by_subtag = dict()
+            self.languages_by_script = dict()
+            try:
+                if not self._load_parsed_registry():
+                    self._fetch_registry()
+                    self._parse_registry()
+                    self._save_parsed_registry()
+            except Exception:
+                # don't leave partial tables behind to be mistaken for loaded ones
+                for name in self._registry_tables:
+                    del self.__dict__[name]
+                raise
+            shared = (
+                self.scripts_by_description,
+                self.scripts_by_subtag,
+                self.languages_by_script,
+            )
+            ScriptDetector._shared_registries[self._parsed_registry_path] = shared
+        (
+            self.scripts_by_description,
+            self.scripts_by_subtag,
+            self.languages_by_script,
+        ) = shared
+
+    def detect_scripts(self, text: str) -> tuple[str, ...]:
+        """
+        Detect the script(s) used in the input text.
+
+        Args:
+            text (str): The input text in its original script.
+        Returns:
+            tuple[str, ...]: The script codes detected in the input text, sorted.
+        Notes:
+            This method looks up the Unicode Script property of each letter in the text in the
+            range table generated from the UCD (see scripts_data.py). Letters whose script is
+            Common, Inherited, or Unknown do not identify a writing system and are ignored.
+        """
+        if text.isascii():
+            # ASCII letters are all Latin script
+            return _LATN if any(map(str.isalpha, text)) else ()
+        cache = self._scripts_cache
+        scripts = cache.get(text)
+        if scripts is None:
+            # texts made up of the same characters have the same scripts, so fall back on a
+            # cache keyed by character set (a string key is cheaper to hash, so try it first)
+            chars = frozenset(text)
+            charsets_cache = self._charsets_cache
+            scripts = charsets_cache.get(chars)
+            if scripts is None:
+                scripts = self._detect_scripts(chars)
+                charsets_cache[chars] = scripts
+                if len(charsets_cache) > _SCRIPTS_CACHE_SIZE:
+                    del charsets_cache[next(iter(charsets_cache))]
+            cache[text] = scripts
+            if len(cache) > _SCRIPTS_CACHE_SIZE:
+                # evict the oldest entry
+                del cache[next(iter(cache))]
+        return scripts
+
+    def _detect_scripts(self, chars: frozenset[str]) -> tuple[str, ...]:
+        """
+        Detect the script(s) used in a set of non-ASCII characters, without caching; see
+        detect_scripts().
+        """
+        # Working on the distinct characters keeps this to one lookup per character; a
+        # vectorized (NumPy searchsorted) lookup was measured 4-5x slower on
+        # place-name-length strings and no faster on long ones.
+        script_tags = set(map(_SCRIPT_BY_CODEPOINT.__getitem__, map(ord, chars)))
+        script_tags.discard(None)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("script tags: %s", script_tags)
+        return tuple(sorted(script_tags))
+
+    def _fetch_registry(self):
+        """
+        Fetch the IANA Language Subtag Registry.
+        """
+        from webiquette.webi import Webi
+
         headers = {
             "User-Agent": "pleiades_writing_systems Romanizer ScriptDetector/https://pleiades.stoa.org, pleiades.admin@nyu.edu",
             "From": "pleiades.admin@nyu.edu",
         }
-        cache_max_age = timedelta(days=30)
         webi = Webi(
             netloc="iana.org",
             headers=headers,
-            expire_after=cache_max_age,
+            expire_after=_REGISTRY_MAX_AGE,
             respect_robots_txt=False,
         )
         r = webi.get(
             "https://www.iana.org/assignments/language-subtag-registry/language-subtag-registry"
         )
         self._registry = r.text
-        self.scripts_by_description = dict()
-        self.scripts_by_subtag = dict()
-        self.languages_by_script = dict()
-        self._parse_registry()
 
-    @lru_cache(maxsize=5000)
-    def detect_scripts(self, text: str) -> list[str]:  # type: ignore
+    def _load_parsed_registry(self) -> bool:
         """
-        Detect the script(s) used in the input text.
+        Load the script and language tables parsed from the registry, if cached on disk and fresh.
 
-        Args:
-            text (str): The input text in its original script.
         Returns:
-            set[str]: A set of script codes detected in the input text.
-        Notes:
-            This method uses Unicode character properties to identify the scripts present in the text.
-        """
-        chars = set(text)
-        scriptnames = {unicodedata.name(c).split(" ")[0] for c in chars if c.isalpha()}
-        logger = logging.getLogger(__name__)
-        logger.debug(f"script names: {pformat(scriptnames)}")
-        script_tags = {
-            self.scripts_by_description.get(name.title()) for name in scriptnames
-        }
-        return list(script_tags)  # type: ignore
+            bool: True if the tables were loaded from the cache, False otherwise.
+        """
+        try:
+            age = time.time() - self._parsed_registry_path.stat().st_mtime
+            if age > _REGISTRY_MAX_AGE.total_seconds():
+                return False
+            with open(self._parsed_registry_path, "rb") as f:
+                (
+                    self.scripts_by_description,
+                    self.scripts_by_subtag,
+                    self.languages_by_script,
+                ) = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError) as err:
+            _logger.warning(
+                "Ignoring unreadable parsed registry cache '%s': %s",
+                self._parsed_registry_path,
+                err,
+            )
+            return False
+        return True
+
+    def _save_parsed_registry(self):
+        """
+        Cache the script and language tables parsed from the registry on disk.
+        """
+        try:
+            self._parsed_registry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._parsed_registry_path, "wb") as f:
+                pickle.dump(
+                    (
+                        self.scripts_by_description,
+                        self.scripts_by_subtag,
+                        self.languages_by_script,
+                    ),
+                    f,
+                )
+        except OSError as err:
+            _logger.warning(
+                "Could not cache parsed registry at '%s': %s",
+                self._parsed_registry_path,
+                err,
+            )
+
+    def _raise_malformed_line(self, entry_type: str, entry: str):
+        """
+        Raise ValueError for the first line of a registry entry that is not a field.
+        """
+        for line in entry.splitlines():
+            if line[:2] != "  " and not self._field_re.match(line):
+                err = ValueError(f"Malformed field line '{line}'")
+                err.add_note(f"while parsing {entry_type} entry: {entry}")
+                raise err
 
     def _parse_registry(self):
         """
         Parse the IANA Language Subtag Registry to extract script subtags.
         """
-        entries = self._registry.split("%%\n")
-        for entry in entries:
-            lines = entry.strip().split("\n")
-            continuation_lines = [l for l in lines if l.startswith("  ")]
-            if continuation_lines:
-                new_lines = []
-                for line in lines:
-                    if line.startswith("  "):
-                        " ".join((new_lines[-1], line[2:]))
-                    else:
-                        new_lines.append(line)
-                lines = new_lines
-            if lines[0] == "Type: language":
+        for match in self._entry_re.finditer(self._registry):
+            entry_type, entry = match.groups()
+            fields = self._field_re.findall(entry)
+            # every line but continuation lines must be a "Field-Name: value" line
+            field_lines = entry.count("\n") + (not entry.endswith("\n"))
+            if len(fields) != field_lines - entry.count("\n  "):
+                self._raise_malformed_line(entry_type, entry)
+            if "\n  " in entry:
+                fields = [(prefix, _fold_field(suffix)) for prefix, suffix in fields]
+            if entry_type == "language":
                 subtag = ""
                 script = ""
-                for line in lines[1:]:
-                    try:
-                        prefix, suffix = line.split(": ", 1)
-                    except ValueError as err:
-                        err.add_note(f"while parsing language entry: {entry}")
-                        raise
+                for prefix, suffix in fields:
                     if prefix == "Subtag":
                         if subtag:
                             raise ValueError(
                                 f"Multiple Subtag fields in single language entry: {entry}"
                             )
-                        subtag = line.split(": ", 1)[1].strip()
+                        subtag = suffix.strip()
                     elif prefix == "Suppress-Script":
                         if script:
                             raise ValueError(
                                 f"Multiple Script fields in single language entry: {entry}"
                             )
-                        script = line.split(": ", 1)[1].strip()
-                    elif prefix in {
-                        "Added",
-                        "Comments",
-                        "Description",
-                        "Scope",
-                        "Macrolanguage",
-                        "Deprecated",
-                        "Preferred-Value",
-                    }:
+                        script = suffix.strip()
+                    elif prefix in _IGNORED_LANGUAGE_FIELDS:
                         pass
                     else:
                         raise ValueError(
                             f"Unexpected field '{prefix}' in language entry: {entry}"
                         )
                 if subtag and script:
-                    try:
-                        self.languages_by_script[script]
-                    except KeyError:
-                        self.languages_by_script[script] = set()
-                    self.languages_by_script[script].add(subtag)
-            elif lines[0] == "Type: script":
+                    self.languages_by_script.setdefault(sys.intern(script), set()).add(
+                        sys.intern(subtag)
+                    )
+            else:
                 subtag = ""
                 descriptions = set()
-                for line in lines[1:]:
-                    try:
-                        prefix, suffix = line.split(": ", 1)
-                    except ValueError as err:
-                        err.add_note(f"while parsing script entry: {entry}")
-                        raise
+                for prefix, suffix in fields:
                     if prefix == "Subtag":
                         if subtag:
                             raise ValueError(
                                 f"Multiple Subtag fields in single script entry: {entry}"
                             )
-                        subtag = line.split(": ", 1)[1].strip()
+                        subtag = suffix.strip()
                     elif prefix == "Description":
                         descriptions.add(suffix.strip())
-                    elif prefix in {"Added", "Comments"}:
+                    elif prefix in _IGNORED_SCRIPT_FIELDS:
                         pass
                     else:
                         raise ValueError(
                             f"Unexpected field '{prefix}' in script entry: {entry}"
                         )
                 if subtag and descriptions:
+                    subtag = sys.intern(subtag)
+                    # setdefault stores and checks for duplicates in one lookup
                     for description in descriptions:
-                        try:
-                            self.scripts_by_description[description]
-                        except KeyError:
-                            self.scripts_by_description[description] = subtag
-                        else:
+                        existing = self.scripts_by_description.setdefault(
+                            description, subtag
+                        )
+                        if existing != subtag:
                             raise ValueError(
-                                f"Duplicate script description '{description}' for subtags '{self.scripts_by_description[description]}' and '{subtag}'"
+                                f"Duplicate script description '{description}' for subtags '{existing}' and '{subtag}'"
                             )
-                    try:
-                        self.scripts_by_subtag[subtag]
-                    except KeyError:
-                        self.scripts_by_subtag[subtag] = descriptions
-                    else:
+                    existing = self.scripts_by_subtag.setdefault(subtag, descriptions)
+                    if existing is not descriptions:
                         raise ValueError(
-                            f"Duplicate script subtag '{subtag}' for descriptions '{self.scripts_by_subtag[subtag]}' and '{descriptions}'"
+                            f"Duplicate script subtag '{subtag}' for descriptions '{existing}' and '{descriptions}'"
                         )
+
+
+@lru_cache(maxsize=1)
+def _shared_script_detector() -> ScriptDetector:
+    """
+    Return the ScriptDetector shared by all Romanizer instances, constructing it on first use.
+    """
+    return ScriptDetector()
@@ -0,0 +1,28 @@
+#
+# This file is part of pleiades_writing_systems
+# by Tom Elliott for the Institute for the Study of the Ancient World
+# (c) Copyright 2025 by New York University
+# Licensed under the AGPL-3.0; see LICENSE.txt file.
+#
+
+"""
+Shared test fixtures
+"""
+from pleiades_writing_systems.romanization import Romanizer, ScriptDetector
+import pytest
+
+
+@pytest.fixture(scope="session")
+def romanizer():
+    """
+    A Romanizer with the default engines, constructed once for the whole test session.
+    """
+    return Romanizer()
+
+
+@pytest.fixture(scope="session")
+def script_detector():
+    """
+    A ScriptDetector, constructed once for the whole test session.
+    """
+    return ScriptDetector()
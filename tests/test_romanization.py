@@ -8,14 +8,74 @@
 """
 Test the romanization module
 """
-import inspect
+import dataclasses
+from functools import cache
 import logging
 from pathlib import Path
-from pleiades_writing_systems.romanization import Romanizer, RomanString
-from pprint import pformat
+from pleiades_writing_systems.romanization import Romanizer, RomanString, ScriptDetector
+import pytest
+import shutil
+import sys
+import timeit
+from typing import Final
+import unicodedata
 
 logger = logging.getLogger("tests")
-test_data_path = Path(__file__).parent / "data"
+# normalized once, so that every test passes the same NFC string to romanize
+ATHENA = unicodedata.normalize("NFC", "Αθήνα")
+
+# (text, langtag, result_langtag, result_rom, engines) cases for test_romanize_multi_greek
+_GREEK_CANDIDATES: Final = (
+    (
+        ATHENA,
+        "und",
+        "el",
+        {"Athena", "Athina"},
+        {"python-slugify", "romanize-schizas"},
+    ),
+    (
+        ATHENA,
+        "grc",
+        "grc-Grek",
+        {"Athena", "Athḗna"},
+        {"python-slugify", "romanize-manninen"},
+    ),
+    (
+        ATHENA,
+        "el",
+        "el",
+        {"Athena", "Athina"},
+        {"python-slugify", "romanize-schizas"},
+    ),
+    (
+        ATHENA,
+        "grc",
+        "grc-Grek",
+        {"Athena", "Athḗna"},
+        {"python-slugify", "romanize-manninen"},
+    ),
+    ("Athens", "en", "en", {"Athens"}, {"python-slugify", "identity"}),
+    (
+        "Athens",
+        "und",
+        "und-Latn",
+        {"Athens"},
+        {"python-slugify", "identity"},
+    ),  # sic more than one languages uses Latin script by default
+)
+# (text, langtag) cases that romanize should reject
+_FAIL_CANDIDATES: Final = (
+    ("Αθήνa", "el"),  # mixed scripts
+    ("Athens", "grc"),  # language mismatch
+)
+
+
+@cache
+def data_path() -> Path:
+    """
+    Path to the test data directory, built on first use.
+    """
+    return Path(__file__).parent / "data"
 
 
 class TestRomanizerInitialization:
@@ -23,102 +83,182 @@ class TestRomanizerInitialization:
         r = Romanizer()
         assert isinstance(r, Romanizer)
 
+    def test_init_budget(self):
+        # guard against constructors that load or compile large tables on every call; taking
+        # the best of several runs leaves out one-off costs such as importing the engines
+        per_call = min(timeit.repeat(Romanizer, number=5, repeat=5)) / 5
+        assert per_call < 0.01
 
-class TestRomanizer:
-    @classmethod
-    def setup_class(cls):
-        logger.debug(f"starting {cls.__name__}")
-        cls.romanizer = Romanizer()
 
-    @classmethod
-    def teardown_class(cls):
-        del cls.romanizer
-        logger.debug(f"finished {cls.__name__}")
+class TestRomanString:
+    def test_slots_and_equality(self):
+        rs = RomanString(ATHENA, "el", "Athina", "romanize-schizas")
+        assert not hasattr(rs, "__dict__")
+        assert (rs.original, rs.original_lang_tag, rs.romanized, rs.engine) == (
+            ATHENA,
+            "el",
+            "Athina",
+            "romanize-schizas",
+        )
+        assert rs == RomanString(ATHENA, "el", "Athina", "romanize-schizas")
+        assert len({rs, RomanString(ATHENA, "el", "Athina", "romanize-schizas")}) == 1
+        with pytest.raises(AttributeError):
+            rs.romanized = "Athena"
+
+    def test_replace(self):
+        rs = RomanString(ATHENA, "el", "Athina", "romanize-schizas")
+        replaced = dataclasses.replace(rs, romanized="Athena", engine="python-slugify")
+        assert replaced == RomanString(ATHENA, "el", "Athena", "python-slugify")
+        assert replaced.engine is sys.intern("python-slugify")
+
+    def test_legacy_keywords(self):
+        with pytest.warns(DeprecationWarning, match="is deprecated"):
+            rs = RomanString(
+                original_text=ATHENA,
+                original_lang_tag="el",
+                romanized_form="Athina",
+                engine="romanize-schizas",
+            )
+        assert rs == RomanString(ATHENA, "el", "Athina", "romanize-schizas")
+        with pytest.raises(TypeError), pytest.warns(DeprecationWarning):
+            RomanString(
+                ATHENA, "el", "Athina", "romanize-schizas", original_text=ATHENA
+            )
 
+
+class TestRomanizer:
     def setup_method(self, method):
-        logger.debug(f"starting {self.__class__.__name__}::{method.__name__}")
+        logger.debug("starting %s::%s", self.__class__.__name__, method.__name__)
 
     def teardown_method(self, method):
-        logger.debug(f"finished {self.__class__.__name__}::{method.__name__}")
+        logger.debug("finished %s::%s", self.__class__.__name__, method.__name__)
 
-    def test_engines_property(self):
-        engines = self.romanizer.engines
+    def test_engines_property(self, romanizer):
+        engines = romanizer.engines
         assert isinstance(engines, list)
-        assert [
+        assert frozenset(engines) == {
             "arabic2latin",
             "iuliia",
             "python-slugify",
             "romanize-schizas",
             "romanize-manninen",
             "yuconv",
-        ] == engines
+        }
+        assert len(engines) == len(set(engines))
 
-    def test_romanize_multi_greek(self):
-        candidates = [
-            (
-                "Αθήνα",
-                "und",
-                "el",
-                {"Athena", "Athina"},
-                {"python-slugify", "romanize-schizas"},
-            ),
-            (
-                "Αθήνα",
-                "grc",
-                "grc-Grek",
-                {"Athena", "Athḗna"},
-                {"python-slugify", "romanize-manninen"},
-            ),
-            (
-                "Αθήνα",
-                "el",
-                "el",
-                {"Athena", "Athina"},
-                {"python-slugify", "romanize-schizas"},
-            ),
-            (
-                "Αθήνα",
-                "grc",
-                "grc-Grek",
-                {"Athena", "Athḗna"},
-                {"python-slugify", "romanize-manninen"},
-            ),
-            ("Athens", "en", "en", {"Athens"}, {"python-slugify", "identity"}),
-            (
-                "Athens",
-                "und",
-                "und-Latn",
-                {"Athens"},
-                {"python-slugify", "identity"},
-            ),  # sic more than one languages uses Latin script by default
+    @pytest.mark.parametrize(
+        "text,langtag,result_langtag,result_rom,engines", _GREEK_CANDIDATES
+    )
+    def test_romanize_multi_greek(
+        self, romanizer, text, langtag, result_langtag, result_rom, engines
+    ):
+        romanizations = romanizer.romanize(text, langtag)
+        assert isinstance(romanizations, list)
+        for j, romanization in enumerate(romanizations):
+            logger.debug("testing romanization result %d", j)
+            logger.debug("romanization details: %r", romanization)
+            assert isinstance(romanization, RomanString)
+            assert (romanization.original, romanization.original_lang_tag) == (
+                text,
+                result_langtag,
+            )
+            assert romanization.romanized in result_rom
+            assert romanization.engine in engines
+
+    @pytest.mark.parametrize("text,langtag", _FAIL_CANDIDATES)
+    def test_romanize_fail(self, romanizer, text, langtag):
+        romanizations = romanizer.romanize(text, langtag)
+        assert isinstance(romanizations, list)
+        assert len(romanizations) == 0
+
+    def test_romanize_normalization(self, romanizer):
+        nfc = ATHENA
+        nfd = unicodedata.normalize("NFD", ATHENA)
+        assert nfc != nfd
+        romanizations = romanizer.romanize(nfd, "el")
+        assert len(romanizations) > 0
+        assert romanizations == romanizer.romanize(nfc, "el")
+        for romanization in romanizations:
+            assert romanization.original == nfc
+
+    def test_romanize_many(self, romanizer):
+        items = [
+            (ATHENA, "grc"),
+            ("Каменная могила", "ru"),
+            ("Athens", "und"),
+            (ATHENA, "grc"),
+            ("Београд", "sr-Cyrl"),
+            ("Αθήνa", "el"),
+            (ATHENA, "el"),
         ]
-        for i, blob in enumerate(candidates):
-            text, langtag, result_langtag, result_rom, engines = blob
-            romanizations = self.romanizer.romanize(text, langtag)
-            assert isinstance(romanizations, list)
-            for j, romanization in enumerate(romanizations):
-                logger.debug(f"testing romanization result {i}:{j}")
-                if i == 5:
-                    logger.debug(
-                        f"romanization details: {pformat(inspect.getmembers(romanization))}"
-                    )
-                assert isinstance(romanization, RomanString)
-                assert romanization.original == text
-                assert romanization.original_lang_tag == result_langtag
-                assert romanization.romanized in result_rom
-                assert romanization.engine in engines
+        results = romanizer.romanize_many(items)
+        assert list(results.keys()) == list(dict.fromkeys(items))
+        for (text, langtag), romanizations in results.items():
+            assert [(r.romanized, r.engine) for r in romanizations] == [
+                (r.romanized, r.engine) for r in romanizer.romanize(text, langtag)
+            ]
+
+    def test_romanize_ascii_fast_path(self):
+        fast = Romanizer(ascii_fast_path=True)
+        romanizations = fast.romanize("Athens", "en")
+        assert [
+            (r.romanized, r.original_lang_tag, r.engine) for r in romanizations
+        ] == [("Athens", "en", "identity")]
+        assert fast.romanize("Athens", "grc") == []  # language mismatch
+        # not plain ASCII, so the engines still run
+        assert "python-slugify" in {r.engine for r in fast.romanize("St. Paul", "en")}
 
-    def test_romanize_fail(self):
+    def test_romanize_trust_language_tag(self, romanizer):
+        trusting = Romanizer(trust_language_tag=True)
+        # where the sample doesn't match the tag ("Αθήνα" as Russian, Latin "a" in "Αθήνa"),
+        # the scripts are detected in full, so results are the same either way
         candidates = [
-            ("Αθήνa", "el"),  # mixed scripts
-            ("Athens", "grc"),  # language mismatch
+            ("Каменная могила", "ru"),
+            (ATHENA, "el"),
+            (ATHENA, "ru"),
+            ("Αθήνa", "el"),
         ]
         for text, langtag in candidates:
-            romanizations = self.romanizer.romanize(text, langtag)
-            assert isinstance(romanizations, list)
-            assert len(romanizations) == 0
+            assert trusting.romanize(text, langtag) == romanizer.romanize(text, langtag)
+
+        # 61 characters are sampled every 7th, so a Latin "x" at index 1 goes unnoticed:
+        # the trusted check romanizes the text, where full detection rejects it
+        mixed = "Αx" + "θήνα " * 11 + "Αθήν"
+        assert len(mixed) == 61
+        assert romanizer.romanize(mixed, "el") == []
+        assert {r.engine for r in trusting.romanize(mixed, "el")} >= {"python-slugify"}
+
+    def test_romanize_many_shared_lang_tags(self, romanizer):
+        texts = ["Каменная могила", "Москва", "Каменная могила"]
+        results = romanizer.romanize_many(texts, "ru")
+        assert list(results.keys()) == [("Каменная могила", "ru"), ("Москва", "ru")]
+        for (text, langtag), romanizations in results.items():
+            assert [(r.romanized, r.engine) for r in romanizations] == [
+                (r.romanized, r.engine) for r in romanizer.romanize(text, langtag)
+            ]
 
-    def test_romanize_russian(self):
+    def test_romanize_many_cache(self):
+        fresh = Romanizer()
+        cached = fresh.romanize(ATHENA, "el")
+        results = fresh.romanize_many([ATHENA, "Αθήνα "], "el")
+        assert results[(ATHENA, "el")] is cached
+        assert results[("Αθήνα ", "el")] is fresh.romanize("Αθήνα ", "el")
+        # every language tag is validated before anything is romanized
+        with pytest.raises(ValueError, match="'not a tag!'"):
+            fresh.romanize_many([("Москва", "ru"), ("Москва", "not a tag!")])
+        assert ("Москва", "ru", ()) not in fresh._romanize_cache
+
+    def test_romanize_thread_pool(self, romanizer):
+        items = [("Каменная могила", "ru"), (ATHENA, "grc")]
+        with Romanizer(max_workers=4) as pooled:
+            for text, langtag in items:
+                assert pooled.romanize(text, langtag) == romanizer.romanize(
+                    text, langtag
+                )
+            assert pooled.romanize_many(items) == romanizer.romanize_many(items)
+        assert pooled._pool is None
+
+    def test_romanize_russian(self, romanizer):
         candidates = [
             (
                 "Каменная могила",
@@ -137,13 +277,15 @@ class TestRomanizer:
         ]
         for i, blob in enumerate(candidates):
             text, langtag, result_rom, engines = blob
-            romanizations = self.romanizer.romanize(text, langtag)
+            romanizations = romanizer.romanize(text, langtag)
             assert isinstance(romanizations, list)
             for j, romanization in enumerate(romanizations):
-                logger.debug(f"testing romanization result {i}:{j}")
+                logger.debug("testing romanization result %d:%d", i, j)
                 assert isinstance(romanization, RomanString)
-                assert romanization.original == text
-                assert romanization.original_lang_tag == langtag
+                assert (romanization.original, romanization.original_lang_tag) == (
+                    text,
+                    langtag,
+                )
                 try:
                     assert romanization.romanized in result_rom
                 except AssertionError:
@@ -152,7 +294,7 @@ class TestRomanizer:
                     }
                 assert romanization.engine in engines
 
-    def test_romanize_serbian_cyrillic_yuconv(self):
+    def test_romanize_serbian_cyrillic_yuconv(self, romanizer):
         candidates = [
             (
                 "Београд",
@@ -163,17 +305,19 @@ class TestRomanizer:
         ]
         for i, blob in enumerate(candidates):
             text, langtag, result_rom, engines = blob
-            romanizations = self.romanizer.romanize(text, langtag)
+            romanizations = romanizer.romanize(text, langtag)
             assert isinstance(romanizations, list)
             for j, romanization in enumerate(romanizations):
-                logger.debug(f"testing romanization result {i}:{j}")
+                logger.debug("testing romanization result %d:%d", i, j)
                 assert isinstance(romanization, RomanString)
-                assert romanization.original == text
-                assert romanization.original_lang_tag == langtag
+                assert (romanization.original, romanization.original_lang_tag) == (
+                    text,
+                    langtag,
+                )
                 assert romanization.romanized in result_rom
                 assert romanization.engine in engines
 
-    def test_romanize_arabic(self):
+    def test_romanize_arabic(self, romanizer):
         candidates = [
             (
                 "السَّلَامُ عَلَيْكَ",
@@ -185,15 +329,96 @@ class TestRomanizer:
         for i, blob in enumerate(candidates):
             text, langtag, result_rom, engines = blob
             omit = ("romanize-manninen",)
-            romanizations = self.romanizer.romanize(text, langtag, omit_engines=omit)
+            romanizations = romanizer.romanize(text, langtag, omit_engines=omit)
             assert isinstance(romanizations, list)
             for j, romanization in enumerate(romanizations):
-                logger.debug(f"testing romanization result {i}:{j}")
-                logger.debug(
-                    f"romanization details: {pformat(inspect.getmembers(romanization))}"
-                )
+                logger.debug("testing romanization result %d:%d", i, j)
+                logger.debug("romanization details: %r", romanization)
                 assert isinstance(romanization, RomanString)
-                assert romanization.original == text
-                assert romanization.original_lang_tag == langtag
+                assert (romanization.original, romanization.original_lang_tag) == (
+                    text,
+                    langtag,
+                )
                 assert romanization.romanized in result_rom
                 assert romanization.engine in engines
+
+    def test_romanize_ancient_hebrew(self, romanizer):
+        romanizations = romanizer.romanize("שלום", "hbo")
+        assert {r.engine: r.romanized for r in romanizations} == {
+            "python-slugify": "shlvm",
+            "romanize-manninen": "slfM",
+        }
+        assert {r.original_lang_tag for r in romanizations} == {"hbo-Hebr"}
+
+
+class TestScriptDetector:
+    def test_detect_scripts(self, script_detector):
+        candidates = [
+            (ATHENA, ("Grek",)),
+            ("Athens", ("Latn",)),
+            ("Αθήνa", ("Grek", "Latn")),
+            ("aΑθήν", ("Grek", "Latn")),
+            ("السَّلَامُ عَلَيْكَ", ("Arab",)),
+            ("Каменная могила", ("Cyrl",)),
+            ("1453", ()),
+            ("St. Paul, 1453", ("Latn",)),
+            ("Saint-Étienne", ("Latn",)),
+        ]
+        for text, scripts in candidates:
+            assert script_detector.detect_scripts(text) == scripts
+
+    def test_cache_dir(self, script_detector, tmp_path, monkeypatch):
+        # load the default tables first: a detector with its own cache_dir must still use it
+        script_detector.scripts_by_subtag
+        cache_file = tmp_path / "registry-2.pkl"
+        shutil.copyfile(script_detector._parsed_registry_path, cache_file)
+
+        def fetch_registry(self):
+            raise AssertionError("registry fetched despite a fresh cache file")
+
+        monkeypatch.setattr(ScriptDetector, "_fetch_registry", fetch_registry)
+        # share tables through a copy, so the entry for tmp_path goes away with the test
+        monkeypatch.setattr(
+            ScriptDetector,
+            "_shared_registries",
+            dict(ScriptDetector._shared_registries),
+        )
+        detector = ScriptDetector(cache_dir=tmp_path)
+        assert detector.scripts_by_subtag == script_detector.scripts_by_subtag
+        assert cache_file in ScriptDetector._shared_registries
+
+
+def _parse_registry(registry: str) -> ScriptDetector:
+    """
+    Parse a registry string with a fresh ScriptDetector, bypassing the shared tables.
+    """
+    detector = ScriptDetector()
+    detector._registry = registry
+    detector.scripts_by_description = dict()
+    detector.scripts_by_subtag = dict()
+    detector.languages_by_script = dict()
+    detector._parse_registry()
+    return detector
+
+
+class TestParseRegistry:
+    def test_continuation_lines(self):
+        registry = (
+            "%%\n"
+            "Type: script\n"
+            "Subtag: Hntl\n"
+            "Description: Han (Traditional variant) with Latin (alias for Hant +\n"
+            "  Latn)\n"
+            "Added: 2024-03-04\n"
+            "%%\n"
+        )
+        detector = _parse_registry(registry)
+        description = "Han (Traditional variant) with Latin (alias for Hant + Latn)"
+        assert detector.scripts_by_subtag == {"Hntl": {description}}
+        assert detector.scripts_by_description == {description: "Hntl"}
+
+    def test_malformed_field_line(self):
+        registry = "%%\nType: script\nSubtag: Xxxx\nDescription:Broken\n%%\n"
+        with pytest.raises(ValueError, match="Description:Broken") as excinfo:
+            _parse_registry(registry)
+        assert excinfo.value.__notes__[0].startswith("while parsing script entry:")
@@ -9,6 +9,13 @@
 Test the CHANGEME module
 """
 
+from functools import cache
 from pathlib import Path
 
-test_data_path = Path(__file__).parent / "data"
+
+@cache
+def data_path() -> Path:
+    """
+    Path to the test data directory, built on first use.
+    """
+    return Path(__file__).parent / "data"
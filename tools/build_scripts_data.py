@@ -0,0 +1,125 @@
+#
+# This file is part of pleiades_writing_systems
+# by Tom Elliott for the Institute for the Study of the Ancient World
+# (c) Copyright 2025 by New York University
+# Licensed under the AGPL-3.0; see LICENSE.txt file.
+#
+
+"""
+build_scripts_data: generate src/pleiades_writing_systems/scripts_data.py from the UCD
+
+Usage:
+    python tools/build_scripts_data.py Scripts.txt PropertyValueAliases.txt
+
+Both input files are published in the Unicode Character Database, e.g.
+https://www.unicode.org/Public/UCD/latest/ucd/
+"""
+from pathlib import Path
+import re
+import sys
+
+OUTPUT_PATH = (
+    Path(__file__).parent.parent
+    / "src"
+    / "pleiades_writing_systems"
+    / "scripts_data.py"
+)
+UNKNOWN = "Zzzz"  # ISO 15924 code for unassigned code points
+MAX_CODEPOINT = 0x10FFFF
+
+rx_scripts_line = re.compile(
+    r"^(?P<start>[0-9A-F]{4,6})(?:\.\.(?P<end>[0-9A-F]{4,6}))?\s*;\s*(?P<name>\w+)"
+)
+rx_alias_line = re.compile(r"^sc\s*;\s*(?P<code>\w{4})\s*;\s*(?P<name>\w+)")
+
+
+def read_aliases(path: Path) -> dict[str, str]:
+    """
+    Map long Unicode script names (e.g. "Greek") to ISO 15924 codes (e.g. "Grek").
+    """
+    aliases = dict()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        m = rx_alias_line.match(line)
+        if m:
+            aliases[m.group("name")] = m.group("code")
+    return aliases
+
+
+def read_ranges(path: Path, aliases: dict[str, str]) -> tuple[str, list]:
+    """
+    Read Scripts.txt into a sorted, gap-free list of (start, script_code) pairs.
+    """
+    lines = path.read_text(encoding="utf-8").splitlines()
+    version = lines[0].lstrip("# ").strip()
+    assigned = list()
+    for line in lines:
+        m = rx_scripts_line.match(line)
+        if m is None:
+            continue
+        start = int(m.group("start"), 16)
+        end = int(m.group("end") or m.group("start"), 16)
+        assigned.append((start, end, aliases[m.group("name")]))
+    assigned.sort()
+    ranges = list()
+    next_cp = 0
+    for start, end, code in assigned:
+        if start > next_cp:
+            ranges.append((next_cp, UNKNOWN))
+        ranges.append((start, code))
+        next_cp = end + 1
+    if next_cp <= MAX_CODEPOINT:
+        ranges.append((next_cp, UNKNOWN))
+    # merge adjacent ranges that share a script
+    merged = list()
+    for start, code in ranges:
+        if merged and merged[-1][1] == code:
+            continue
+        merged.append((start, code))
+    return version, merged
+
+
+def render(version: str, ranges: list) -> str:
+    """
+    Render the (start, script_code) ranges as the source of scripts_data.py.
+    """
+    out = [
+        "#",
+        "# This file is part of pleiades_writing_systems",
+        "# by Tom Elliott for the Institute for the Study of the Ancient World",
+        "# (c) Copyright 2025 by New York University",
+        "# Licensed under the AGPL-3.0; see LICENSE.txt file.",
+        "#",
+        "# NOTE: This file was auto-generated with tools/build_scripts_data.py.",
+        f"# Source: {version} from the Unicode Character Database",
+        "# License: https://www.unicode.org/license.txt",
+        "#",
+        "",
+        '"""',
+        "scripts_data: code point to ISO 15924 script code ranges (Unicode Script property)",
+        "",
+        "_STARTS[i] is the first code point of a range running up to _STARTS[i + 1] - 1,",
+        "all of which have the script code _SCRIPTS[i]. Look up a code point with",
+        "_SCRIPTS[bisect_right(_STARTS, cp) - 1].",
+        '"""',
+        "",
+        "_STARTS = (",
+    ]
+    out.extend(f"    0x{start:04X}," for start, _ in ranges)
+    out.append(")")
+    out.append("")
+    out.append("_SCRIPTS = (")
+    out.extend(f'    "{code}",' for _, code in ranges)
+    out.append(")")
+    out.append("")
+    return "\n".join(out)
+
+
+def main(scripts_path: str, aliases_path: str):
+    aliases = read_aliases(Path(aliases_path))
+    version, ranges = read_ranges(Path(scripts_path), aliases)
+    OUTPUT_PATH.write_text(render(version, ranges), encoding="utf-8")
+    print(f"wrote {len(ranges)} ranges from {version} to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])